@@ -0,0 +1,69 @@
+"""
+Measures clipboard streaming throughput against a stub host.
+
+The stub replaces powershell.exe with a python process that only moves bytes,
+so the results show the overhead of the WSL side of the bridge.
+
+Usage: PYTHONPATH=. python benchmarks/clipboard_benchmark.py [size in MB...]
+(or without PYTHONPATH after `pip install -e .`)
+"""
+import sys
+from time import perf_counter
+from wbridge.clipboard import copy_to_clipboard, paste_from_clipboard
+
+
+class NullWriter:
+    def write(self, b) -> int:
+        return len(b)
+
+
+class ZeroReader:
+    def __init__(self, size: int):
+        self.remaining = size
+
+    def read(self, n: int = -1) -> bytes:
+        if n < 0 or n > self.remaining:
+            n = self.remaining
+        self.remaining -= n
+        return bytes(n)
+
+
+SINK_STUB = """\
+import sys
+while sys.stdin.buffer.read(64 * 1024):
+    pass
+"""
+SOURCE_STUB = """\
+import sys
+remaining = int(sys.argv[1])
+chunk = bytes(64 * 1024)
+while remaining > 0:
+    remaining -= sys.stdout.buffer.write(chunk[:remaining])
+"""
+
+
+def measure(name: str, size: int, fn):
+    start = perf_counter()
+    fn()
+    elapsed = perf_counter() - start
+    throughput = size / elapsed / 2**20
+    print(f"{name:>6} {size >> 20:6d} MB {elapsed:8.3f} s {throughput:10.1f} MB/s")
+
+
+def main() -> int:
+    sizes = [int(s) << 20 for s in sys.argv[1:]] or [1 << 20, 16 << 20, 128 << 20]
+    sink = [sys.executable, "-c", SINK_STUB]
+
+    for size in sizes:
+        measure("copy", size, lambda: copy_to_clipboard(ZeroReader(size), host=sink))
+
+        source = [sys.executable, "-c", SOURCE_STUB, str(size)]
+        measure(
+            "paste", size, lambda: paste_from_clipboard(NullWriter(), host=source)
+        )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,53 @@
+"""
+Measures path conversion throughput of ConversionPool as workers are added.
+
+Uses a synthetic conversion context, so it doesn't have to run under WSL.
+
+Usage: PYTHONPATH=. python benchmarks/convertpool_benchmark.py [number of paths]
+(or without PYTHONPATH after `pip install -e .`)
+"""
+import sys
+from os import cpu_count
+from time import perf_counter
+from wbridge.convertpool import ConversionPool
+from wbridge.pathconvert import ConversionContext
+
+CONTEXT = ConversionContext(
+    "/home/user", "Ubuntu-22.04", {"C:": ["/mnt/c"], "D:": ["/mnt/d"]}
+)
+
+
+def measure(paths: list[str], workers: int, processes: bool, **kwargs) -> float:
+    with ConversionPool(workers, processes=processes) as pool:
+        # Warm up the workers, so startup cost isn't measured
+        pool.convert(paths[: pool.chunk_size * workers * 2], CONTEXT, **kwargs)
+
+        start = perf_counter()
+        pool.convert(paths, CONTEXT, **kwargs)
+        return len(paths) / (perf_counter() - start)
+
+
+def main() -> int:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    linux_paths = [f"/mnt/c/Users/user/file{i}.txt" for i in range(count)]
+    windows_paths = [f"D:\\Data\\file{i}.txt" for i in range(count)]
+
+    workers = [1]
+    while workers[-1] * 2 <= (cpu_count() or 1):
+        workers.append(workers[-1] * 2)
+
+    print(f"{'pool':>8} {'workers':>7} {'to windows':>14} {'to linux':>14}")
+    for processes in [False, True]:
+        for n in workers:
+            to_windows = measure(linux_paths, n, processes)
+            to_linux = measure(windows_paths, n, processes, from_windows=True)
+            print(
+                f"{'process' if processes else 'thread':>8} {n:7d} "
+                f"{to_windows:10.0f} p/s {to_linux:10.0f} p/s"
+            )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,181 @@
+import os
+import sys
+from threading import Thread
+from base64 import b64decode
+from io import BytesIO
+from subprocess import CalledProcessError
+import pytest
+from wbridge.clipboard import (
+    _encoded_command,
+    clipboard_copy_script,
+    clipboard_paste_script,
+    copy_to_clipboard,
+    paste_from_clipboard,
+    paste_to_file,
+)
+
+# Stub hosts standing in for powershell.exe. Powershell arguments are appended
+# after the file name, so they end up in sys.argv[2:] and are ignored.
+COPY_STUB = (
+    "import shutil, sys; shutil.copyfileobj(sys.stdin.buffer, open(sys.argv[1], 'wb'))"
+)
+PASTE_STUB = (
+    "import shutil, sys; shutil.copyfileobj(open(sys.argv[1], 'rb'), sys.stdout.buffer)"
+)
+
+# Only writes the payload after reaching EOF, like powershell does.
+BUFFERED_COPY_STUB = (
+    "import sys; data = sys.stdin.buffer.read(); open(sys.argv[1], 'wb').write(data)"
+)
+
+PAYLOAD = "zażółć gęślą jaźń\n".encode() * 10000
+
+
+def test_encoded_command():
+    flag, encoded = _encoded_command("Get-Clipboard")
+    assert flag == "-EncodedCommand"
+    assert b64decode(encoded).decode("utf-16-le") == "Get-Clipboard"
+
+
+def test_clipboard_scripts():
+    assert "SetText" in clipboard_copy_script("text")
+    assert "SetImage" in clipboard_copy_script("image")
+    assert "GetText" in clipboard_paste_script("text")
+    assert "ImageFormat]::Png" in clipboard_paste_script("image")
+    assert "CopyTo($data, 1024)" in clipboard_copy_script("text", 1024)
+
+    with pytest.raises(ValueError):
+        clipboard_copy_script("html")
+
+
+def test_copy_to_clipboard(tmp_path):
+    clipboard = tmp_path / "clipboard"
+    host = [sys.executable, "-c", COPY_STUB, str(clipboard)]
+    copy_to_clipboard(BytesIO(PAYLOAD), host=host, chunk_size=4096)
+    assert clipboard.read_bytes() == PAYLOAD
+
+
+def test_paste_from_clipboard(tmp_path):
+    clipboard = tmp_path / "clipboard"
+    clipboard.write_bytes(PAYLOAD)
+    host = [sys.executable, "-c", PASTE_STUB, str(clipboard)]
+    output = BytesIO()
+    paste_from_clipboard(output, "image", host=host, chunk_size=4096)
+    assert output.getvalue() == PAYLOAD
+
+
+def test_clipboard_host_failure():
+    host = [sys.executable, "-c", "import sys; sys.exit(3)"]
+    with pytest.raises(CalledProcessError) as e:
+        copy_to_clipboard(BytesIO(PAYLOAD), host=host)
+    assert e.value.returncode == 3
+
+    with pytest.raises(CalledProcessError):
+        paste_from_clipboard(BytesIO(), host=host)
+
+
+class FailingReader:
+    def __init__(self):
+        self.calls = 0
+
+    def read(self, n: int = -1) -> bytes:
+        self.calls += 1
+        if self.calls > 2:
+            raise OSError("read failed")
+        return b"x" * n
+
+
+def test_copy_to_clipboard_source_failure(tmp_path):
+    clipboard = tmp_path / "clipboard"
+    host = [sys.executable, "-c", BUFFERED_COPY_STUB, str(clipboard)]
+    with pytest.raises(OSError, match="read failed"):
+        copy_to_clipboard(FailingReader(), host=host, chunk_size=4096)
+    assert not clipboard.exists()
+
+
+def test_paste_to_file(tmp_path):
+    clipboard = tmp_path / "clipboard"
+    clipboard.write_bytes(PAYLOAD)
+    output = tmp_path / "output"
+    output.write_bytes(b"old contents")
+    output.chmod(0o640)
+
+    host = [sys.executable, "-c", PASTE_STUB, str(clipboard)]
+    paste_to_file(str(output), host=host)
+    assert output.read_bytes() == PAYLOAD
+    assert output.stat().st_mode & 0o777 == 0o640
+    assert sorted(tmp_path.iterdir()) == [clipboard, output]
+
+
+def test_paste_to_file_failure(tmp_path):
+    output = tmp_path / "output"
+    output.write_bytes(b"old contents")
+
+    host = [sys.executable, "-c", "import sys; print('partial'); sys.exit(1)"]
+    with pytest.raises(CalledProcessError):
+        paste_to_file(str(output), host=host)
+    assert output.read_bytes() == b"old contents"
+
+    with pytest.raises(CalledProcessError):
+        paste_to_file(str(tmp_path / "new"), host=host)
+    assert list(tmp_path.iterdir()) == [output]
+
+
+def test_paste_to_file_new_file_mode(tmp_path):
+    clipboard = tmp_path / "clipboard"
+    clipboard.write_bytes(PAYLOAD)
+    output = tmp_path / "output"
+
+    host = [sys.executable, "-c", PASTE_STUB, str(clipboard)]
+    paste_to_file(str(output), host=host)
+
+    umask = os.umask(0)
+    os.umask(umask)
+    assert output.stat().st_mode & 0o777 == 0o666 & ~umask
+
+
+def test_paste_to_file_symlink(tmp_path):
+    clipboard = tmp_path / "clipboard"
+    clipboard.write_bytes(PAYLOAD)
+    real = tmp_path / "real"
+    real.write_bytes(b"old")
+    link = tmp_path / "link"
+    link.symlink_to(real)
+
+    host = [sys.executable, "-c", PASTE_STUB, str(clipboard)]
+    paste_to_file(str(link), host=host)
+    assert link.is_symlink()
+    assert real.read_bytes() == PAYLOAD
+
+
+def test_paste_to_file_hard_link(tmp_path):
+    clipboard = tmp_path / "clipboard"
+    clipboard.write_bytes(PAYLOAD)
+    output = tmp_path / "output"
+    output.write_bytes(b"old")
+    other = tmp_path / "other"
+    os.link(output, other)
+
+    host = [sys.executable, "-c", PASTE_STUB, str(clipboard)]
+    paste_to_file(str(output), host=host)
+    assert other.read_bytes() == PAYLOAD
+    assert output.stat().st_ino == other.stat().st_ino
+
+
+def test_paste_to_file_fifo(tmp_path):
+    clipboard = tmp_path / "clipboard"
+    clipboard.write_bytes(PAYLOAD)
+    fifo = tmp_path / "fifo"
+    os.mkfifo(fifo)
+
+    received = []
+    reader = Thread(target=lambda: received.append(fifo.read_bytes()))
+    reader.start()
+
+    host = [sys.executable, "-c", PASTE_STUB, str(clipboard)]
+    paste_to_file(str(fifo), host=host)
+    reader.join()
+
+    assert received == [PAYLOAD]
+    assert fifo.is_fifo()
+    assert sorted(tmp_path.iterdir()) == [clipboard, fifo]
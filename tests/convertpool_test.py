@@ -0,0 +1,95 @@
+from threading import Thread
+import pytest
+from wbridge.convertpool import ConversionPool, convert_paths
+from wbridge.pathconvert import ConversionContext
+
+MOUNTS = {"C:": ["/mnt/c"], "D:": ["/media/d"]}
+CONTEXT = ConversionContext("/", "Ubuntu-22.04", MOUNTS)
+OTHER_CONTEXT = ConversionContext("/mnt/c/Users", "Debian", {"C:": ["/c"]})
+
+
+def test_convert_paths():
+    assert convert_paths(["/mnt/c/Windows", "/media/d/x", "/etc"], CONTEXT) == [
+        "C:\\Windows",
+        "D:\\x",
+        "\\\\wsl$\\Ubuntu-22.04\\etc",
+    ]
+
+    assert convert_paths(["/mnt/c/Windows", "/c/Windows"], OTHER_CONTEXT) == [
+        "\\\\wsl$\\Debian\\mnt\\c\\Windows",
+        "C:\\Windows",
+    ]
+
+    assert convert_paths(
+        ["C:\\Windows", "\\\\wsl$\\Ubuntu-22.04\\etc"], CONTEXT, from_windows=True
+    ) == ["/mnt/c/Windows", "/etc"]
+
+
+def test_convert_paths_relative_to_context_cwd():
+    context = ConversionContext("/mnt/c", "Ubuntu-22.04", MOUNTS)
+    assert convert_paths(["Windows", "../c/Users"], context) == [
+        "Windows",
+        "Users",
+    ]
+
+
+@pytest.mark.parametrize(
+    "processes, start_method",
+    [(False, "forkserver"), (True, "forkserver"), (True, "spawn")],
+)
+def test_conversion_pool_preserves_order(processes, start_method):
+    paths = [f"/mnt/c/dir{i}" for i in range(1000)]
+    expected = [f"C:\\dir{i}" for i in range(1000)]
+
+    with ConversionPool(
+        4, processes=processes, start_method=start_method, chunk_size=16
+    ) as pool:
+        assert pool.convert(paths, CONTEXT) == expected
+        assert pool.convert(paths[:10], CONTEXT) == expected[:10]
+        assert pool.convert(expected, CONTEXT, from_windows=True) == paths
+
+
+def test_conversion_pool_concurrent_contexts():
+    paths = [f"/c/dir{i}" for i in range(500)]
+    results = {}
+
+    def convert(name, context):
+        results[name] = pool.convert(paths, context)
+
+    with ConversionPool(4, chunk_size=8) as pool:
+        threads = [
+            Thread(target=convert, args=(name, context))
+            for name, context in [("ubuntu", CONTEXT), ("debian", OTHER_CONTEXT)]
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+    assert results["ubuntu"] == [
+        f"\\\\wsl$\\Ubuntu-22.04\\c\\dir{i}" for i in range(500)
+    ]
+    assert results["debian"] == [f"C:\\dir{i}" for i in range(500)]
+
+
+def test_conversion_pool_errors():
+    with pytest.raises(ValueError):
+        ConversionPool(chunk_size=0)
+
+    with ConversionPool(2, chunk_size=1) as pool:
+        with pytest.raises(ValueError, match="distro"):
+            pool.convert(["/a", "/b"], ConversionContext("/", None, MOUNTS))
+
+        with pytest.raises(ValueError, match="cwd, mounts"):
+            pool.convert(["/a"], ConversionContext(None, "Ubuntu-22.04", None))
+
+        relative_cwd = ConversionContext("rel", "Ubuntu-22.04", MOUNTS)
+        with pytest.raises(ValueError, match="absolute"):
+            pool.convert(["/a", "/b"], relative_cwd)
+
+        # Converting windows paths doesn't use the working directory
+        assert pool.convert(["C:\\a"], relative_cwd, from_windows=True) == ["/mnt/c/a"]
+
+    for paths in [["/a"], ["/a", "/b", "/c"]]:
+        with pytest.raises(RuntimeError, match="closed"):
+            pool.convert(paths, CONTEXT)
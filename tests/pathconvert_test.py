@@ -1,6 +1,12 @@
-from wbridge.pathconvert import linux_to_windows as l2w, windows_to_linux as w2l
+from wbridge.pathconvert import (
+    current_context,
+    linux_to_windows as l2w,
+    windows_to_linux as w2l,
+)
 from wbridge.mounts import find_wsl_mounts
+from os import environ
 from unittest.mock import patch
+import pytest
 
 DISTRO_NAME = "Ubuntu-22.04"
 
@@ -52,3 +58,27 @@ def test_arbitrary_mount_path_conversion():
     assert (
         l2w("/mnt/c/Windows") == l2w("/completely/arbitrary/Windows") == "C:\\Windows"
     )
+
+
+def test_explicit_context_path_conversion():
+    mounts = {"D:": ["/media/d"]}
+    assert l2w("/media/d/file", DISTRO_NAME, mounts=mounts) == "D:\\file"
+    assert w2l("D:\\file", DISTRO_NAME, mounts=mounts) == "/media/d/file"
+    assert l2w("d/file", DISTRO_NAME, cwd="/media", mounts=mounts) == "d\\file"
+    assert l2w("file:///media/d/x", DISTRO_NAME, mounts=mounts) == "file:///D:/x"
+
+    with pytest.raises(ValueError):
+        l2w("file", DISTRO_NAME, cwd="relative", mounts=mounts)
+
+
+@patch.dict(environ, {"WSL_DISTRO_NAME": "Changed"})
+def test_distro_name_read_on_call():
+    assert l2w("/etc/hosts", mounts={}) == "\\\\wsl$\\Changed\\etc\\hosts"
+
+
+@patch.dict(environ, {"WSL_DISTRO_NAME": DISTRO_NAME})
+def test_current_context_reads_mounts():
+    with patch("wbridge.pathconvert.read_wsl_mounts", return_value={"C:": ["/c"]}):
+        assert current_context().mounts == {"C:": ["/c"]}
+    with patch("wbridge.pathconvert.read_wsl_mounts", return_value={"D:": ["/d"]}):
+        assert current_context().mounts == {"D:": ["/d"]}
@@ -0,0 +1,212 @@
+import os
+import subprocess
+from base64 import b64encode
+from secrets import token_hex
+from shutil import copyfileobj
+from stat import S_ISREG
+from typing import BinaryIO
+
+
+CLIPBOARD_FORMATS = ["text", "image"]
+
+# Size of a single read/write on the pipe to powershell.
+# Keeps memory usage on the WSL side bounded regardless of payload size.
+CHUNK_SIZE = 64 * 1024
+
+POWERSHELL_HOST = ["powershell.exe", "-NoProfile", "-NonInteractive", "-STA"]
+
+_PRELUDE = """\
+$ErrorActionPreference = "Stop"
+Add-Type -AssemblyName System.Windows.Forms
+Add-Type -AssemblyName System.Drawing
+"""
+
+_READ_STDIN = """\
+$data = New-Object System.IO.MemoryStream
+[Console]::OpenStandardInput().CopyTo($data, {chunk_size})
+$data.Position = 0
+"""
+
+_COPY_SCRIPTS = {
+    "text": _READ_STDIN + """\
+$text = (New-Object System.Text.UTF8Encoding $false).GetString($data.ToArray())
+if ($text.Length -eq 0) {{
+    [System.Windows.Forms.Clipboard]::Clear()
+}} else {{
+    [System.Windows.Forms.Clipboard]::SetText($text)
+}}
+""",
+    "image": _READ_STDIN + """\
+$image = [System.Drawing.Image]::FromStream($data)
+[System.Windows.Forms.Clipboard]::SetImage($image)
+$image.Dispose()
+""",
+}
+
+_PASTE_SCRIPTS = {
+    "text": """\
+$text = [System.Windows.Forms.Clipboard]::GetText()
+$bytes = (New-Object System.Text.UTF8Encoding $false).GetBytes($text)
+$data = New-Object System.IO.MemoryStream(, $bytes)
+""",
+    "image": """\
+$image = [System.Windows.Forms.Clipboard]::GetImage()
+if ($null -eq $image) {{
+    [Console]::Error.WriteLine("Clipboard does not contain an image.")
+    exit 1
+}}
+$data = New-Object System.IO.MemoryStream
+$image.Save($data, [System.Drawing.Imaging.ImageFormat]::Png)
+$image.Dispose()
+$data.Position = 0
+""",
+}
+
+_WRITE_STDOUT = """\
+$stdout = [Console]::OpenStandardOutput()
+$data.CopyTo($stdout, {chunk_size})
+$stdout.Flush()
+"""
+
+
+def _check_format(format: str):
+    if format not in CLIPBOARD_FORMATS:
+        raise ValueError(
+            f"Unsupported clipboard format '{format}'. "
+            f"Expected one of: {', '.join(CLIPBOARD_FORMATS)}."
+        )
+
+
+def _encoded_command(script: str) -> list[str]:
+    """
+    Returns powershell arguments running script without creating a file for it.
+    """
+    encoded = b64encode(script.encode("utf-16-le")).decode("ascii")
+    return ["-EncodedCommand", encoded]
+
+
+def clipboard_copy_script(format: str, chunk_size: int = CHUNK_SIZE) -> str:
+    """
+    Returns powershell script that puts its stdin in the clipboard as format.
+    """
+    _check_format(format)
+    return _PRELUDE + _COPY_SCRIPTS[format].format(chunk_size=chunk_size)
+
+
+def clipboard_paste_script(format: str, chunk_size: int = CHUNK_SIZE) -> str:
+    """
+    Returns powershell script that writes clipboard contents in format to stdout.
+    Text is written as UTF-8, images are written as PNG.
+    """
+    _check_format(format)
+    return (
+        _PRELUDE
+        + _PASTE_SCRIPTS[format].format(chunk_size=chunk_size)
+        + _WRITE_STDOUT.format(chunk_size=chunk_size)
+    )
+
+
+def copy_to_clipboard(source: BinaryIO, format: str = "text", *,
+                      host: list[str] = POWERSHELL_HOST,
+                      chunk_size: int = CHUNK_SIZE):  # fmt: skip
+    """
+    Streams source into the Windows clipboard. Text has to be UTF-8 encoded,
+    images can be in any format supported by System.Drawing.
+    Raises CalledProcessError if powershell fails.
+    """
+    cmd = host + _encoded_command(clipboard_copy_script(format, chunk_size))
+    with subprocess.Popen(cmd, stdin=subprocess.PIPE) as proc:
+        try:
+            copyfileobj(source, proc.stdin, chunk_size)
+        except BrokenPipeError:
+            # Powershell exited early, the return code will tell why
+            pass
+        except BaseException:
+            # Closing stdin would make powershell copy the truncated payload
+            proc.kill()
+            raise
+        finally:
+            try:
+                proc.stdin.close()
+            except BrokenPipeError:
+                pass
+
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, cmd)
+
+
+def paste_from_clipboard(destination: BinaryIO, format: str = "text", *,
+                         host: list[str] = POWERSHELL_HOST,
+                         chunk_size: int = CHUNK_SIZE):  # fmt: skip
+    """
+    Streams the Windows clipboard contents into destination.
+    Text is written as UTF-8, images are written as PNG.
+    Raises CalledProcessError if powershell fails.
+    """
+    cmd = host + _encoded_command(clipboard_paste_script(format, chunk_size))
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE) as proc:
+        copyfileobj(proc.stdout, destination, chunk_size)
+
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, cmd)
+
+
+def _create_temp_file(directory: str) -> tuple[int, str]:
+    """
+    Creates an empty file with a random name in directory.
+    Unlike mkstemp, the file gets the same permissions as one made by open().
+    """
+    while True:
+        path = os.path.join(directory, f".wb-clip-{token_hex(8)}")
+        try:
+            return os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666), path
+        except FileExistsError:
+            continue
+
+
+def _replaceable(st: os.stat_result | None) -> bool:
+    """
+    Returns true if a file with stat result st can be replaced by a new file
+    without losing anything besides its contents.
+    """
+    if st is None:
+        return True
+    return (
+        S_ISREG(st.st_mode)
+        and st.st_nlink == 1
+        and st.st_uid == os.geteuid()
+        and st.st_gid == os.getegid()
+    )
+
+
+def paste_to_file(path: str, format: str = "text", *,
+                  host: list[str] = POWERSHELL_HOST,
+                  chunk_size: int = CHUNK_SIZE):  # fmt: skip
+    """
+    Streams the Windows clipboard contents into the file at path.
+    Regular files are written to a temporary file in the same directory, which
+    replaces the file only after pasting succeeds, so it's left untouched on
+    failure. Symlinks are followed. Devices, pipes, hard linked files and files
+    owned by someone else are written in place instead.
+    """
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        st = None
+
+    if not _replaceable(st):
+        with open(path, "wb") as f:
+            paste_from_clipboard(f, format, host=host, chunk_size=chunk_size)
+        return
+
+    path = os.path.realpath(path)
+    fd, temp_path = _create_temp_file(os.path.dirname(path))
+    try:
+        with open(fd, "wb") as f:
+            if st is not None:
+                os.fchmod(f.fileno(), st.st_mode & 0o7777)
+            paste_from_clipboard(f, format, host=host, chunk_size=chunk_size)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
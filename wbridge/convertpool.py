@@ -0,0 +1,120 @@
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import get_context
+from threading import Lock
+from .pathconvert import ConversionContext, linux_to_windows, windows_to_linux
+
+
+def convert_paths(paths: list[str], context: ConversionContext, *,
+                  from_windows: bool = False) -> list[str]:  # fmt: skip
+    """
+    Converts paths using only the state stored in context.
+    """
+    if None in context:
+        missing = ", ".join(k for k, v in context._asdict().items() if v is None)
+        raise ValueError(f"Conversion context is incomplete, missing: {missing}.")
+
+    if from_windows:
+        return [windows_to_linux(p, context.distro, mounts=context.mounts)
+                for p in paths]  # fmt: skip
+
+    return [
+        linux_to_windows(p, context.distro, cwd=context.cwd, mounts=context.mounts)
+        for p in paths
+    ]
+
+
+def _convert_chunk(args: tuple[list[str], ConversionContext, bool]) -> list[str]:
+    paths, context, from_windows = args
+    return convert_paths(paths, context, from_windows=from_windows)
+
+
+class ConversionPool:
+    """
+    Converts batches of paths on a pool of worker threads or processes.
+
+    Every request carries its own ConversionContext, so requests for different
+    working directories, distros or mount tables don't affect each other.
+    Conversion never reads the current directory, WSL_DISTRO_NAME or
+    /proc/mounts of the process, except for resolving symlinks.
+
+    convert() can be called from any number of threads at once. Results are
+    always returned in the same order as the input paths. Contexts are only
+    read, so they can be shared between requests, but must not be modified
+    while a request using them is running.
+
+    Requests with at most chunk_size paths are converted in the calling
+    thread. Larger ones are split into chunks of chunk_size paths, which are
+    converted on the pool. Threads have little overhead, but share the GIL;
+    processes scale with CPU cores, but have to pickle every chunk.
+
+    Worker processes are started with the start_method multiprocessing context.
+    It defaults to "forkserver", because forking a multi-threaded process
+    is unsafe. "spawn" works as well, "fork" should only be used by
+    single-threaded callers.
+
+    After close(), convert() raises RuntimeError for requests of any size.
+    Requests that started before close() finish normally.
+    """
+
+    def __init__(self, max_workers: int | None = None, *,
+                 processes: bool = False,
+                 start_method: str = "forkserver",
+                 chunk_size: int = 256):  # fmt: skip
+        if chunk_size < 1:
+            raise ValueError("chunk_size has to be a positive integer.")
+
+        self.chunk_size = chunk_size
+        self.closed = False
+        # Makes checking closed and submitting chunks atomic with respect to close()
+        self.lock = Lock()
+        self.executor: Executor
+        if processes:
+            self.executor = ProcessPoolExecutor(
+                max_workers, mp_context=get_context(start_method)
+            )
+        else:
+            self.executor = ThreadPoolExecutor(max_workers)
+
+    def convert(self, paths: list[str], context: ConversionContext, *,
+                from_windows: bool = False) -> list[str]:  # fmt: skip
+        """
+        Converts paths using context. Raises the first ValueError raised
+        while converting any of the paths.
+        """
+        if len(paths) <= self.chunk_size:
+            with self.lock:
+                self._check_open()
+            return convert_paths(paths, context, from_windows=from_windows)
+
+        chunks = [
+            (paths[i : i + self.chunk_size], context, from_windows)
+            for i in range(0, len(paths), self.chunk_size)
+        ]
+
+        with self.lock:
+            self._check_open()
+            # map() submits every chunk before returning
+            results = self.executor.map(_convert_chunk, chunks)
+
+        ret: list[str] = []
+        for converted in results:
+            ret += converted
+        return ret
+
+    def _check_open(self):
+        if self.closed:
+            raise RuntimeError("Cannot convert paths with a closed ConversionPool.")
+
+    def close(self):
+        """
+        Waits for running requests to finish and shuts down the workers.
+        """
+        with self.lock:
+            self.closed = True
+        self.executor.shutdown()
+
+    def __enter__(self) -> "ConversionPool":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -17,10 +17,10 @@ def parse_mounts() -> list[MountedDevice]:
         ]
 
 
-@cache
-def find_wsl_mounts() -> dict[str, list[str]]:
+def read_wsl_mounts() -> dict[str, list[str]]:
     """
-    Returns a dict of drives/UNC shares mapped to lists of their WSL mount points
+    Returns a dict of drives/UNC shares mapped to lists of their WSL mount points.
+    Reads /proc/mounts on every call.
     """
     ret: dict[str, list[str]] = {}
     for device, mount, fstype in parse_mounts():
@@ -33,3 +33,11 @@ def find_wsl_mounts() -> dict[str, list[str]]:
         ret.setdefault(device.rstrip("\\"), []).append(mount)
 
     return ret
+
+
+@cache
+def find_wsl_mounts() -> dict[str, list[str]]:
+    """
+    Returns the result of read_wsl_mounts() from its first call.
+    """
+    return read_wsl_mounts()
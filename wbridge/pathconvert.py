@@ -1,19 +1,47 @@
 import re
+from collections import namedtuple
 from urllib.parse import urlparse
 from pathlib import PosixPath as Path, PureWindowsPath
 from os import environ
 from .misc import is_url, relative_to_subdir
-from .mounts import find_wsl_mounts
+from .mounts import find_wsl_mounts, read_wsl_mounts
 
 
-def linux_to_windows(
-    input: str,
-    current_distro: str | None = environ.get("WSL_DISTRO_NAME"),
-) -> str:
+# Everything path conversion depends on, besides the path itself.
+# mounts has the same layout as the return value of find_wsl_mounts().
+ConversionContext = namedtuple("ConversionContext", ["cwd", "distro", "mounts"])
+
+
+def current_context() -> ConversionContext:
+    """
+    Returns a snapshot of the conversion context of the current process.
+    """
+    return ConversionContext(str(Path.cwd()), _current_distro(None), read_wsl_mounts())
+
+
+def _current_distro(current_distro: str | None) -> str:
+    if current_distro is None:
+        current_distro = environ.get("WSL_DISTRO_NAME")
     if current_distro is None:
         raise ValueError(
             "Distro name has to be specified manually when WSL_DISTRO_NAME is unset."
         )
+    return current_distro
+
+
+def linux_to_windows(
+    input: str,
+    current_distro: str | None = None,
+    *,
+    cwd: str | None = None,
+    mounts: dict[str, list[str]] | None = None,
+) -> str:
+    """
+    Converts a linux path to a windows path.
+    current_distro and cwd default to the state of the current process, which is
+    read on every call. cwd has to be absolute. mounts defaults to find_wsl_mounts().
+    """
+    current_distro = _current_distro(current_distro)
 
     input = input.strip()
 
@@ -23,18 +51,27 @@ def linux_to_windows(
         if scheme != "file":
             return input
         # PureWindowsPath.as_uri() doesn't work for UNC paths.
-        return "file:///" + linux_to_windows(urlpath).replace("\\", "/")
+        return "file:///" + linux_to_windows(
+            urlpath, current_distro, cwd=cwd, mounts=mounts
+        ).replace("\\", "/")
+
+    if cwd is not None and not Path(cwd).is_absolute():
+        raise ValueError(f"Working directory '{cwd}' has to be absolute.")
+
+    working_dir = Path.cwd() if cwd is None else Path(cwd).resolve()
+    if mounts is None:
+        mounts = find_wsl_mounts()
 
     path = Path(input)
     is_rel = not path.is_absolute()
 
-    path = path.resolve()
+    path = working_dir.joinpath(path).resolve()
 
-    if is_rel and path.is_relative_to(Path.cwd()):
-        return str(path.relative_to(Path.cwd())).replace("/", "\\")
+    if is_rel and path.is_relative_to(working_dir):
+        return str(path.relative_to(working_dir)).replace("/", "\\")
 
     # If the path is located on a windows drive or a mounted UNC share
-    for windows_root, mountpoints in find_wsl_mounts().items():
+    for windows_root, mountpoints in mounts.items():
         for mount in mountpoints:
             if path.is_relative_to(mount):
                 return str(
@@ -57,12 +94,16 @@ def linux_to_windows(
 
 def windows_to_linux(
     input: str,
-    current_distro: str | None = environ.get("WSL_DISTRO_NAME"),
+    current_distro: str | None = None,
+    *,
+    mounts: dict[str, list[str]] | None = None,
 ) -> str:
-    if current_distro is None:
-        raise ValueError(
-            "Distro name has to be specified manually when WSL_DISTRO_NAME is unset."
-        )
+    """
+    Converts a windows path to a linux path.
+    current_distro defaults to WSL_DISTRO_NAME, which is read on every call.
+    mounts defaults to find_wsl_mounts().
+    """
+    current_distro = _current_distro(current_distro)
 
     input = input.strip()
 
@@ -71,15 +112,20 @@ def windows_to_linux(
         if scheme != "file":
             return input
         # Skip the leading slash in URL path
-        return Path(windows_to_linux(urlpath[1:])).as_uri()
+        return Path(
+            windows_to_linux(urlpath[1:], current_distro, mounts=mounts)
+        ).as_uri()
 
     path = PureWindowsPath(input)
     if not path.is_absolute():
         return path.as_posix()
 
+    if mounts is None:
+        mounts = find_wsl_mounts()
+
     path_prefix = None
-    if (mounts := find_wsl_mounts().get(path.drive)) is not None:
-        path_prefix = mounts[0]
+    if (mountpoints := mounts.get(path.drive)) is not None:
+        path_prefix = mountpoints[0]
     elif (instance_path := re.search(r"^\\\\wsl\$\\(.+)$", path.drive)) is not None:
         if instance_path[1] == current_distro:
             path_prefix = "/"
@@ -1,5 +1,6 @@
 from argparse import ArgumentParser
 from .alias import AliasSubCommand
+from .clip import ClipSubCommand
 from .convert import ConvertSubCommand
 from .open import OpenSubCommand
 from .run import RunSubCommand
@@ -15,6 +16,7 @@ def create_argument_parser() -> ArgumentParser:
 
     for c in [
             AliasSubCommand,
+            ClipSubCommand,
             ConvertSubCommand,
             OpenSubCommand,
             RunSubCommand,
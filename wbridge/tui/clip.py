@@ -0,0 +1,103 @@
+import os
+import signal
+from sys import stderr, stdin, stdout
+from subprocess import CalledProcessError
+from argparse import ArgumentParser
+from .subcommand import SubCommand
+from ..clipboard import (
+    CLIPBOARD_FORMATS,
+    copy_to_clipboard,
+    paste_from_clipboard,
+    paste_to_file,
+)
+
+class ClipSubCommand(SubCommand):
+    def handle(self, args) -> int:
+        try:
+            if args.action == "copy":
+                return self._copy(args)
+            return self._paste(args)
+        except CalledProcessError as e:
+            print(f"ERROR: Clipboard {args.action} failed.", file=stderr)
+            # Negative return codes mean powershell was killed by a signal
+            return e.returncode if e.returncode > 0 else 128 - e.returncode
+        except BrokenPipeError:
+            # Stdout was closed early, e.g. by head. Point it at /dev/null,
+            # so flushing it at exit doesn't raise again.
+            os.dup2(os.open(os.devnull, os.O_WRONLY), stdout.fileno())
+            return 128 + signal.SIGPIPE
+
+    @staticmethod
+    def _copy(args) -> int:
+        if args.file is None:
+            source_name = "stdin"
+            f = stdin.buffer
+        else:
+            source_name = f"'{args.file}'"
+            try:
+                f = open(args.file, "rb")
+            except OSError as e:
+                print(f"ERROR: Cannot open {source_name}: {e.strerror}.", file=stderr)
+                return 1
+
+        try:
+            copy_to_clipboard(f, args.format)
+        except OSError as e:
+            print(f"ERROR: Cannot read {source_name}: {e.strerror}.", file=stderr)
+            return 1
+        finally:
+            if args.file is not None:
+                f.close()
+        return 0
+
+    @staticmethod
+    def _paste(args) -> int:
+        if args.file is None:
+            paste_from_clipboard(stdout.buffer, args.format)
+            stdout.buffer.flush()
+            return 0
+
+        try:
+            paste_to_file(args.file, args.format)
+        except OSError as e:
+            print(f"ERROR: Cannot write '{args.file}': {e.strerror}.", file=stderr)
+            return 1
+        return 0
+
+    def create_subparser(self, subparsers) -> ArgumentParser:
+        """
+        Adds clip subcommand to argument parser
+        """
+        clip_parser: ArgumentParser = subparsers.add_parser(
+            "clip",
+            description="""\
+            Copy data to or paste data from the Windows clipboard.
+            Text is always transferred as UTF-8.
+            """,
+        )
+
+        actions = clip_parser.add_subparsers(dest="action", required=True)
+        copy_parser = actions.add_parser(
+            "copy",
+            description="Copy stdin or a file to the clipboard.",
+        )
+        paste_parser = actions.add_parser(
+            "paste",
+            description="Paste the clipboard to stdout or a file.",
+        )
+
+        for parser in [copy_parser, paste_parser]:
+            parser.add_argument(
+                "file",
+                nargs="?",
+                help="Use this file instead of stdin/stdout.",
+            )
+
+            parser.add_argument(
+                "-f", "--format",
+                choices=CLIPBOARD_FORMATS,
+                default="text",
+                help="Clipboard data format. Images are pasted as PNG. Default: text",
+            )  # fmt: skip
+
+        return clip_parser